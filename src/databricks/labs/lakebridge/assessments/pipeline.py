@@ -15,6 +15,9 @@ from databricks.labs.lakebridge.connections.credential_manager import cred_file
 from databricks.labs.lakebridge.assessments.profiler_config import PipelineConfig, Step
 from databricks.labs.lakebridge.connections.database_manager import DatabaseManager
 
+# The LibYAML C loader is considerably faster than the pure-Python fallback.
+_YamlLoader: type = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 logger = logging.getLogger(__name__)
 logger.setLevel("INFO")
 
@@ -181,7 +184,7 @@ class PipelineClass:
     @staticmethod
     def load_config_from_yaml(file_path: str) -> PipelineConfig:
         with open(file_path, 'r', encoding='utf-8') as file:
-            data = yaml.safe_load(file)
+            data = yaml.load(file, Loader=_YamlLoader)
         steps = [Step(**step) for step in data['steps']]
         return PipelineConfig(
             name=data['name'], version=data['version'], extract_folder=data['extract_folder'], steps=steps
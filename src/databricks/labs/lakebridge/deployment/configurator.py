@@ -1,5 +1,6 @@
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from databricks.labs.blueprint.tui import Prompts
 from databricks.sdk import WorkspaceClient
@@ -185,15 +186,29 @@ class ResourceConfigurator:
         user_name = self._user.user_name
         assert user_name is not None
 
-        catalog_access = self.has_necessary_catalog_access(catalog_name, user_name, catalog_required_privileges)
-        schema_access = self.has_necessary_schema_access(
-            catalog_name, schema_name, user_name, schema_required_privileges
-        )
-        required_access = catalog_access and schema_access
-        if volume_name:
-            volume_access = self.has_necessary_volume_access(
-                catalog_name, schema_name, volume_name, user_name, volume_required_privileges
-            )
-            required_access = required_access and volume_access
+        # The catalog, schema and volume probes are independent workspace round-trips,
+        # so run them concurrently and combine the results afterwards.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            checks = [
+                executor.submit(
+                    self.has_necessary_catalog_access, catalog_name, user_name, catalog_required_privileges
+                ),
+                executor.submit(
+                    self.has_necessary_schema_access, catalog_name, schema_name, user_name, schema_required_privileges
+                ),
+            ]
+            if volume_name:
+                checks.append(
+                    executor.submit(
+                        self.has_necessary_volume_access,
+                        catalog_name,
+                        schema_name,
+                        volume_name,
+                        user_name,
+                        volume_required_privileges,
+                    )
+                )
+            results = [check.result() for check in checks]
+        required_access = all(results)
         if not required_access:
             raise SystemExit("Cannot continue installation, without necessary access. Aborting the installation.")
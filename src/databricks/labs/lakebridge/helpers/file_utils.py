@@ -35,8 +35,16 @@ def dir_walk(root: Path):
     :param root: Path
     :return: tuple of  root, subdirectory , files
     """
-    sub_dirs = [d for d in root.iterdir() if d.is_dir()]
-    files = [f for f in root.iterdir() if f.is_file()]
+    sub_dirs: list[Path] = []
+    files: list[Path] = []
+    # A single scandir pass classifies entries from the cached DirEntry type,
+    # instead of two iterdir walks that stat() every entry.
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                sub_dirs.append(Path(entry.path))
+            elif entry.is_file():
+                files.append(Path(entry.path))
     yield root, sub_dirs, files
 
     for each_dir in sub_dirs:
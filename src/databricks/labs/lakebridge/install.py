@@ -1,22 +1,30 @@
 import re
 import abc
 import dataclasses
+import functools
 import shutil
-from collections.abc import Iterable
-from json import loads, dump
+import threading
+import io
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from json import load, loads, dumps
 import logging
 import os
 from shutil import rmtree, move
 from subprocess import run, CalledProcessError
 import sys
-from typing import Any, cast
-from urllib import request
-from urllib.error import URLError, HTTPError
+import tempfile
+import time
+from typing import IO, Any, cast
+import urllib.request
 import webbrowser
 from datetime import datetime, timezone
 from pathlib import Path
 import xml.etree.ElementTree as ET
-from zipfile import ZipFile
+from zipfile import BadZipFile, ZipFile
+
+import urllib3
+from urllib3.exceptions import HTTPError
 
 from databricks.labs.blueprint.installation import Installation, JsonValue
 from databricks.labs.blueprint.installation import SerdeError
@@ -45,12 +53,53 @@ logger = logging.getLogger(__name__)
 
 TRANSPILER_WAREHOUSE_PREFIX = "Lakebridge Transpiler Validation"
 
+# Prompt choices, folded once at import instead of re-iterating the enums per prompt.
+_RECON_SOURCE_CHOICES = tuple(source_type.value for source_type in ReconSourceType)
+_RECON_REPORT_CHOICES = tuple(report_type.value for report_type in ReconReportType)
+# Sources whose "schema" is prompted for as a database name.
+_ORACLE_LIKE_SOURCES = frozenset({ReconSourceType.ORACLE.value})
+
+
+def _new_http_pool() -> urllib3.PoolManager:
+    """Shared connection pool so that metadata probes and artifact downloads against the same
+    host (pypi.org, pypi.debian.net, repo.maven.apache.org) reuse TCP+TLS connections.
+
+    Honors HTTP(S)_PROXY environment variables, like the urllib.request calls it replaced.
+    """
+    pool_args: dict[str, Any] = {
+        "maxsize": 4,
+        "retries": urllib3.Retry(total=3, backoff_factor=0.3),
+        "timeout": urllib3.Timeout(connect=10.0, read=30.0),
+    }
+    proxies = urllib.request.getproxies()
+    proxy_url = proxies.get("https") or proxies.get("http")
+    if proxy_url:
+        return urllib3.ProxyManager(proxy_url, **pool_args)
+    return urllib3.PoolManager(**pool_args)
+
+
+_http_pool = _new_http_pool()
+
+# Resolved once at import: Path.home() consults the environment on every call.
+_LABS_PATH = Path.home() / ".databricks" / "labs"
+
 
 class TranspilerInstaller(abc.ABC):
 
+    # Parsed transpiler configs, keyed by the transpilers directory and its mtime so that
+    # installs (which touch the directory) invalidate the cache automatically.
+    # The lock guards cache rebuilds and invalidation when installs run in parallel.
+    _config_cache: tuple[Path, int, dict[str, LSPConfig]] | None = None
+    _config_cache_lock = threading.Lock()
+    # Reverse index of dialect -> transpiler names, rebuilt together with the config cache.
+    _dialect_index: dict[str, set[str]] = {}
+    # Transpiler name -> dialects, either derived from parsed configs or loaded from the
+    # persistent index so that name/dialect queries can skip YAML parsing on a cold start.
+    _summary_cache: tuple[Path, int, dict[str, list[str]]] | None = None
+
     @classmethod
     def labs_path(cls) -> Path:
-        return Path.home() / ".databricks" / "labs"
+        return _LABS_PATH
 
     @classmethod
     def transpilers_path(cls) -> Path:
@@ -59,14 +108,21 @@ class TranspilerInstaller(abc.ABC):
     @classmethod
     def install_from_pypi(cls, product_name: str, pypi_name: str, artifact: Path | None = None) -> Path | None:
         installer = WheelInstaller(product_name, pypi_name, artifact)
-        return installer.install()
+        try:
+            return installer.install()
+        finally:
+            # Installs (including rolled-back ones) may have touched the transpilers directory.
+            cls._invalidate_config_cache()
 
     @classmethod
     def install_from_maven(
         cls, product_name: str, group_id: str, artifact_id: str, artifact: Path | None = None
     ) -> Path | None:
         installer = MavenInstaller(product_name, group_id, artifact_id, artifact)
-        return installer.install()
+        try:
+            return installer.install()
+        finally:
+            cls._invalidate_config_cache()
 
     @classmethod
     def get_installed_version(cls, product_name: str, is_transpiler=True) -> str | None:
@@ -101,25 +157,21 @@ class TranspilerInstaller(abc.ABC):
 
     @classmethod
     def all_transpiler_configs(cls) -> dict[str, LSPConfig]:
-        all_configs = cls._all_transpiler_configs()
-        return {config.name: config for config in all_configs}
+        return cls._cached_transpiler_configs()
 
     @classmethod
     def all_transpiler_names(cls) -> set[str]:
-        all_configs = cls.all_transpiler_configs()
-        return set(all_configs.keys())
+        return set(cls._cached_transpiler_summaries().keys())
 
     @classmethod
     def all_dialects(cls) -> set[str]:
-        all_dialects: set[str] = set()
-        for config in cls._all_transpiler_configs():
-            all_dialects = all_dialects.union(config.remorph.dialects)
-        return all_dialects
+        cls._cached_transpiler_summaries()
+        return set(cls._dialect_index.keys())
 
     @classmethod
     def transpilers_with_dialect(cls, dialect: str) -> set[str]:
-        configs = filter(lambda cfg: dialect in cfg.remorph.dialects, cls.all_transpiler_configs().values())
-        return set(config.name for config in configs)
+        cls._cached_transpiler_summaries()
+        return set(cls._dialect_index.get(dialect, ()))
 
     @classmethod
     def transpiler_config_path(cls, transpiler_name) -> Path:
@@ -137,36 +189,232 @@ class TranspilerInstaller(abc.ABC):
 
     @classmethod
     def _all_transpiler_configs(cls) -> Iterable[LSPConfig]:
+        return cls._cached_transpiler_configs().values()
+
+    @classmethod
+    def _cached_transpiler_configs(cls) -> dict[str, LSPConfig]:
         path = cls.transpilers_path()
-        if path.exists():
-            all_files = os.listdir(path)
-            for file in all_files:
-                config = cls._transpiler_config(cls.transpilers_path() / file)
-                if config:
-                    yield config
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            with cls._config_cache_lock:
+                cls._config_cache = None
+                cls._summary_cache = None
+                cls._dialect_index = {}
+            return {}
+        with cls._config_cache_lock:
+            cached = cls._config_cache
+            if cached is not None and cached[0] == path and cached[1] == mtime_ns:
+                return cached[2]
+            scanned, invalid = cls._scan_transpiler_configs(path)
+            configs = {config.name: config for config in scanned}
+            summaries = {config.name: list(config.remorph.dialects) for config in configs.values()}
+            cls._config_cache = (path, mtime_ns, configs)
+            cls._set_summaries(path, mtime_ns, summaries)
+            cls._store_persistent_index(path, configs, invalid)
+            return configs
 
     @classmethod
-    def _transpiler_config(cls, path: Path) -> LSPConfig | None:
-        if not path.is_dir() or not (path / "lib").is_dir():
+    def _cached_transpiler_summaries(cls) -> dict[str, list[str]]:
+        """Transpiler name -> supported dialects, without parsing YAML when avoidable.
+
+        Name and dialect queries are served from the in-process caches when fresh, then from
+        the persistent index, and only fall back to a full config scan when both are stale.
+        """
+        path = cls.transpilers_path()
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            with cls._config_cache_lock:
+                cls._config_cache = None
+                cls._summary_cache = None
+                cls._dialect_index = {}
+            return {}
+        with cls._config_cache_lock:
+            cached = cls._summary_cache
+            if cached is not None and cached[0] == path and cached[1] == mtime_ns:
+                return cached[2]
+            summaries = cls._load_persistent_index(path)
+            if summaries is not None:
+                cls._set_summaries(path, mtime_ns, summaries)
+                return summaries
+        configs = cls._cached_transpiler_configs()
+        return {config.name: list(config.remorph.dialects) for config in configs.values()}
+
+    @classmethod
+    def _set_summaries(cls, path: Path, mtime_ns: int, summaries: dict[str, list[str]]) -> None:
+        # Callers must hold _config_cache_lock.
+        dialect_index: dict[str, set[str]] = {}
+        for name, dialects in summaries.items():
+            for dialect in dialects:
+                dialect_index.setdefault(dialect, set()).add(name)
+        cls._dialect_index = dialect_index
+        cls._summary_cache = (path, mtime_ns, summaries)
+
+    @classmethod
+    def _index_cache_path(cls) -> Path | None:
+        # The index lives next to the transpilers directory, not inside it: writing there
+        # would bump the directory mtime that keys the in-process caches. Only the standard
+        # layout is persisted, so tests patching transpilers_path() never touch the real
+        # cache under the user's home directory.
+        transpilers = cls.transpilers_path()
+        if transpilers.parent != cls.labs_path():
+            return None
+        return transpilers.parent / ".transpiler-index.json"
+
+    @classmethod
+    def _load_persistent_index(cls, path: Path) -> dict[str, list[str]] | None:
+        """Load the persisted name -> dialects index, if still valid for the given path.
+
+        Every config.yml under the path must match the (mtime_ns, size) recorded when the
+        index was written; any mismatch or unknown directory invalidates the whole index.
+        """
+        index_path = cls._index_cache_path()
+        if index_path is None:
+            return None
+        try:
+            data = loads(index_path.read_text("utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("path") != str(path):
             return None
-        config_path = path / "lib" / "config.yml"
-        if not config_path.is_file():
+        entries = data.get("entries")
+        if not isinstance(entries, dict):
             return None
+        try:
+            return cls._validate_index_entries(path, entries)
+        except OSError:
+            return None
+
+    @classmethod
+    def _validate_index_entries(cls, path: Path, entries: dict[str, Any]) -> dict[str, list[str]] | None:
+        summaries: dict[str, list[str]] = {}
+        with os.scandir(path) as dir_entries:
+            for dir_entry in dir_entries:
+                if not dir_entry.is_dir(follow_symlinks=False):
+                    continue
+                config_path = os.path.join(dir_entry.path, "lib", "config.yml")
+                try:
+                    stat = os.stat(config_path)
+                except OSError:
+                    continue  # No config to parse, same as a scan.
+                entry = entries.get(dir_entry.name)
+                if not isinstance(entry, dict) or not cls._index_entry_fresh(entry, stat):
+                    return None
+                if not entry.get("valid", True):
+                    # Known-bad config: skip it without re-parsing (the load error was
+                    # already reported when the index was built).
+                    continue
+                name = entry.get("name")
+                dialects = entry.get("dialects")
+                if not isinstance(name, str) or not isinstance(dialects, list):
+                    return None
+                summaries[name] = dialects
+        return summaries
+
+    @staticmethod
+    def _index_entry_fresh(entry: dict[str, Any], stat: os.stat_result) -> bool:
+        return entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size
+
+    @classmethod
+    def _store_persistent_index(cls, path: Path, configs: dict[str, LSPConfig], invalid: list[Path]) -> None:
+        entries: dict[str, dict[str, Any]] = {}
+        for config in configs.values():
+            # config.path is <transpilers>/<product>/lib/config.yml
+            try:
+                stat = config.path.stat()
+            except OSError:
+                return
+            entries[config.path.parent.parent.name] = {
+                "name": config.name,
+                "dialects": list(config.remorph.dialects),
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+            }
+        for config_path in invalid:
+            # Remember configs that failed to load, so cold starts skip them too.
+            try:
+                stat = config_path.stat()
+            except OSError:
+                continue
+            entries[config_path.parent.parent.name] = {
+                "valid": False,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+            }
+        index_path = cls._index_cache_path()
+        if index_path is None:
+            return
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_fd, tmp_name = tempfile.mkstemp(dir=index_path.parent, prefix=index_path.name)
+            with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
+                f.write(dumps({"path": str(path), "entries": entries}))
+            os.replace(tmp_name, index_path)
+        except OSError as e:
+            logger.debug(f"Could not store transpiler index: {index_path!s}", exc_info=e)
+
+    @classmethod
+    def _scan_transpiler_configs(cls, path: Path) -> tuple[list[LSPConfig], list[Path]]:
+        configs: list[LSPConfig] = []
+        invalid: list[Path] = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # DirEntry caches the file type, avoiding an extra stat() per entry.
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                config_path = os.path.join(entry.path, "lib", "config.yml")
+                if not os.path.isfile(config_path):
+                    continue
+                config = cls._transpiler_config(Path(config_path))
+                if config:
+                    configs.append(config)
+                else:
+                    invalid.append(Path(config_path))
+        return configs, invalid
+
+    @classmethod
+    def _invalidate_config_cache(cls) -> None:
+        with cls._config_cache_lock:
+            cls._config_cache = None
+            cls._summary_cache = None
+
+    @classmethod
+    def _download_url(cls, url: str) -> Path:
+        """Stream a URL to a temporary file, returning its path.
+
+        Raises `urllib3.exceptions.HTTPError` on connection errors or non-200 responses.
+        """
+        with _http_pool.request("GET", url, preload_content=False) as response:
+            if response.status != 200:
+                raise HTTPError(f"HTTP {response.status} while fetching {url}")
+            with tempfile.NamedTemporaryFile(delete=False) as f:
+                path = Path(f.name)
+                try:
+                    # A 1 MiB buffer keeps syscall counts low for multi-MB artifacts.
+                    shutil.copyfileobj(response, f, length=1 << 20)
+                except Exception:
+                    # Don't leave partial downloads behind in the temp directory.
+                    path.unlink(missing_ok=True)
+                    raise
+        return path
+
+    @classmethod
+    def _transpiler_config(cls, config_path: Path) -> LSPConfig | None:
         try:
             return LSPConfig.load(config_path)
         except ValueError as e:
-            logger.error(f"Could not load config: {path!s}", exc_info=e)
+            logger.error(f"Could not load config: {config_path!s}", exc_info=e)
             return None
 
     @classmethod
     def _store_product_state(cls, product_path: Path, version: str) -> None:
         state_path = product_path / "state"
-        state_path.mkdir()
+        state_path.mkdir(exist_ok=True)
         version_data = {"version": f"v{version}", "date": datetime.now(timezone.utc).isoformat()}
         version_path = state_path / "version.json"
-        with version_path.open("w", encoding="utf-8") as f:
-            dump(version_data, f)
-            f.write("\n")
+        version_path.write_text(dumps(version_data) + "\n", encoding="utf-8")
+        cls._invalidate_config_cache()
 
 
 class WheelInstaller(TranspilerInstaller):
@@ -174,9 +422,15 @@ class WheelInstaller(TranspilerInstaller):
     @classmethod
     def get_latest_artifact_version_from_pypi(cls, product_name: str) -> str | None:
         try:
-            with request.urlopen(f"https://pypi.org/pypi/{product_name}/json") as server:
-                text: bytes = server.read()
-            data: dict[str, Any] = loads(text)
+            url = f"https://pypi.org/pypi/{product_name}/json"
+            with _http_pool.request("GET", url, preload_content=False) as response:
+                if response.status != 200:
+                    logger.error(f"Error while fetching PyPI metadata: {product_name} (HTTP {response.status})")
+                    return None
+                # Decode incrementally off the socket; the full payload includes the complete
+                # release history and can run to hundreds of KB. The response is file-like
+                # with preload_content=False, but urllib3 does not declare it as IO[bytes].
+                data: dict[str, Any] = load(io.TextIOWrapper(cast(IO[bytes], response), encoding="utf-8"))
             return data.get("info", {}).get('version', None)
         except HTTPError as e:
             logger.error(f"Error while fetching PyPI metadata: {product_name}", exc_info=e)
@@ -184,17 +438,19 @@ class WheelInstaller(TranspilerInstaller):
 
     @classmethod
     def download_artifact_from_pypi(cls, product_name: str, version: str, target: Path, extension="whl") -> int:
+        if target.exists():
+            logger.warning(f"Skipping download of {product_name} v{version}; target already exists: {target}")
+            return 0
         suffix = "-py3-none-any.whl" if extension == "whl" else ".tar.gz" if extension == "tar" else f".{extension}"
         filename = f"{product_name.replace('-', '_')}-{version}{suffix}"
         url = f"https://pypi.debian.net/{product_name}/{filename}"
         try:
-            path, _ = request.urlretrieve(url)
+            path = cls._download_url(url)
             logger.info(f"Successfully downloaded {path}")
-            if not target.exists():
-                logger.info(f"Moving {path} to {target!s}")
-                move(path, target)
+            logger.info(f"Moving {path} to {target!s}")
+            move(path, target)
             return 0
-        except URLError as e:
+        except HTTPError as e:
             logger.error("While downloading from pypi", exc_info=e)
             return -1
 
@@ -229,9 +485,8 @@ class WheelInstaller(TranspilerInstaller):
         backup_path = Path(f"{self._product_path!s}-saved")
         if self._product_path.exists():
             os.rename(self._product_path, backup_path)
-        self._product_path.mkdir(parents=True, exist_ok=True)
         self._install_path = self._product_path / "lib"
-        self._install_path.mkdir(exist_ok=True)
+        self._install_path.mkdir(parents=True, exist_ok=True)
         try:
             result = self._unsafe_install_latest_version(version)
             logger.info(f"Successfully installed {self._pypi_name} v{version}")
@@ -246,29 +501,77 @@ class WheelInstaller(TranspilerInstaller):
             return None
 
     def _unsafe_install_latest_version(self, version: str) -> Path | None:
+        if not self._artifact and self._install_direct_from_wheel(version):
+            return self._post_install(version)
         self._create_venv()
         self._install_with_pip()
         self._copy_lsp_resources()
         return self._post_install(version)
 
+    def _install_direct_from_wheel(self, version: str) -> bool:
+        """Fast path for transpilers without dependencies: fetch the wheel and unpack it directly.
+
+        This skips creating a venv and running pip entirely. Returns False when the wheel cannot
+        be located or declares dependencies, in which case the regular pip-based path applies.
+        """
+        url = self._locate_wheel_url()
+        if not url:
+            return False
+        try:
+            wheel = self._download_url(url)
+        except HTTPError as e:
+            logger.debug(f"Could not download wheel for {self._pypi_name} v{version}", exc_info=e)
+            return False
+        try:
+            with ZipFile(wheel) as zip_file:
+                if self._wheel_requires_dependencies(zip_file):
+                    logger.debug(f"{self._pypi_name} v{version} has dependencies, installing with pip")
+                    return False
+                self._site_packages = self._install_path / "site-packages"
+                zip_file.extractall(self._site_packages)
+        except BadZipFile as e:
+            # A truncated download or captive-portal response is not a wheel; fall back to pip.
+            logger.debug(f"Downloaded wheel for {self._pypi_name} v{version} is not usable", exc_info=e)
+            return False
+        finally:
+            wheel.unlink(missing_ok=True)
+        self._copy_lsp_resources()
+        return True
+
+    def _locate_wheel_url(self) -> str | None:
+        """Locate the universal wheel URL for the latest release, if there is one."""
+        try:
+            url = f"https://pypi.org/pypi/{self._pypi_name}/json"
+            with _http_pool.request("GET", url, preload_content=False) as response:
+                if response.status != 200:
+                    return None
+                data: dict[str, Any] = load(io.TextIOWrapper(cast(IO[bytes], response), encoding="utf-8"))
+        except HTTPError as e:
+            logger.debug(f"Error while fetching PyPI metadata: {self._pypi_name}", exc_info=e)
+            return None
+        for entry in data.get("urls", []):
+            if entry.get("filename", "").endswith("-py3-none-any.whl"):
+                return entry.get("url", None)
+        return None
+
+    @classmethod
+    def _wheel_requires_dependencies(cls, zip_file: ZipFile) -> bool:
+        for name in zip_file.namelist():
+            if name.endswith(".dist-info/METADATA"):
+                metadata = zip_file.read(name).decode("utf-8", errors="ignore")
+                return any(line.startswith("Requires-Dist:") for line in metadata.splitlines())
+        # No metadata to inspect: be conservative and let pip resolve.
+        return True
+
     def _create_venv(self) -> None:
-        with chdir(self._install_path):
-            self._unsafe_create_venv()
-
-    def _unsafe_create_venv(self) -> None:
-        # using the venv module doesn't work (maybe it's not possible to create a venv from a venv ?)
-        # so falling back to something that works
-        # for some reason this requires shell=True, so pass full cmd line
-        cmd_line = f"{sys.executable} -m venv .venv"
-        completed = run(cmd_line, stdin=sys.stdin, stdout=sys.stdout, stderr=sys.stderr, shell=True, check=False)
+        # No shell required: pass the arguments as a list and let the subprocess run
+        # in the install directory, instead of forking /bin/sh just to exec python.
+        args = [sys.executable, "-m", "venv", ".venv"]
+        completed = run(
+            args, stdin=sys.stdin, stdout=sys.stdout, stderr=sys.stderr, cwd=self._install_path, check=False
+        )
         if completed.returncode:
             logger.error(f"Failed to create venv, error code: {completed.returncode}")
-            if completed.stdout:
-                for line in completed.stdout:
-                    logger.error(line)
-            if completed.stderr:
-                for line in completed.stderr:
-                    logger.error(line)
         completed.check_returncode()
         self._venv = self._install_path / ".venv"
         self._site_packages = self._locate_site_packages()
@@ -287,45 +590,39 @@ class WheelInstaller(TranspilerInstaller):
 
     def _locate_site_packages_linux_or_macos(self) -> Path:
         lib = self._venv / "lib"
-        for dir_ in os.listdir(lib):
-            if dir_.startswith("python"):
-                packages = lib / dir_ / "site-packages"
-                if packages.exists():
-                    return packages
+        with os.scandir(lib) as entries:
+            for entry in entries:
+                if entry.name.startswith("python") and entry.is_dir(follow_symlinks=False):
+                    packages = lib / entry.name / "site-packages"
+                    if packages.exists():
+                        return packages
         raise ValueError(f"Could not locate 'site-packages' for {self._venv!s}")
 
+    # Skip work pip does by default that is useless here: bytecode compilation of the installed
+    # packages, the self-update check, and waiting on interactive input.
+    _pip_extra_args = ("--no-compile", "--disable-pip-version-check", "--no-input")
+
     def _install_with_pip(self) -> None:
         with chdir(self._install_path):
             # the way to call pip from python is highly sensitive to os and source type
-            if self._artifact:
-                self._install_local_artifact()
-            else:
-                self._install_remote_artifact()
-
-    def _install_local_artifact(self) -> None:
-        pip = self._locate_pip()
-        pip = pip.relative_to(self._install_path)
-        target = self._site_packages
-        target = target.relative_to(self._install_path)
-        if sys.platform == "win32":
-            command = f"{pip!s} install {self._artifact!s} -t {target!s}"
-            completed = run(command, stdin=sys.stdin, stdout=sys.stdout, stderr=sys.stderr, shell=False, check=False)
-        else:
-            command = f"'{pip!s}' install '{self._artifact!s}' -t '{target!s}'"
-            completed = run(command, stdin=sys.stdin, stdout=sys.stdout, stderr=sys.stderr, shell=True, check=False)
-        # checking return code later makes debugging easier
-        completed.check_returncode()
-
-    def _install_remote_artifact(self) -> None:
-        pip = self._locate_pip()
-        pip = pip.relative_to(self._install_path)
-        target = self._site_packages
-        target = target.relative_to(self._install_path)
-        if sys.platform == "win32":
-            args = [str(pip), "install", self._pypi_name, "-t", str(target)]
+            spec = str(self._artifact) if self._artifact else self._pypi_name
+            self._run_pip_install(spec)
+
+    def _run_pip_install(self, spec: str) -> None:
+        target = self._site_packages.relative_to(self._install_path)
+        uv_path = shutil.which("uv")
+        if uv_path:
+            # uv resolves and installs considerably faster than stock pip; use it when available.
+            args = [uv_path, "pip", "install", spec, "--python", str(self._locate_python()), "--target", str(target)]
+            completed = run(args, stdin=sys.stdin, stdout=sys.stdout, stderr=sys.stderr, shell=False, check=False)
+        elif sys.platform == "win32":
+            pip = self._locate_pip().relative_to(self._install_path)
+            args = [str(pip), "install", spec, "-t", str(target), *self._pip_extra_args]
             completed = run(args, stdin=sys.stdin, stdout=sys.stdout, stderr=sys.stderr, shell=False, check=False)
         else:
-            command = f"'{pip!s}' install {self._pypi_name} -t '{target!s}'"
+            pip = self._locate_pip().relative_to(self._install_path)
+            extra_args = " ".join(self._pip_extra_args)
+            command = f"'{pip!s}' install '{spec}' -t '{target!s}' {extra_args}"
             completed = run(command, stdin=sys.stdin, stdout=sys.stdout, stderr=sys.stderr, shell=True, check=False)
         # checking return code later makes debugging easier
         completed.check_returncode()
@@ -333,11 +630,22 @@ class WheelInstaller(TranspilerInstaller):
     def _locate_pip(self) -> Path:
         return self._venv / "Scripts" / "pip3.exe" if sys.platform == "win32" else self._venv / "bin" / "pip3"
 
+    def _locate_python(self) -> Path:
+        return self._venv / "Scripts" / "python.exe" if sys.platform == "win32" else self._venv / "bin" / "python"
+
     def _copy_lsp_resources(self):
         lsp = self._site_packages / "lsp"
         if not lsp.exists():
             raise ValueError("Installed transpiler is missing a 'lsp' folder")
-        shutil.copytree(lsp, self._install_path, dirs_exist_ok=True)
+        try:
+            # The lsp folder lives under the install path, so entries can be renamed into
+            # place instead of copied byte-by-byte.
+            with os.scandir(lsp) as entries:
+                for entry in entries:
+                    os.rename(entry.path, self._install_path / entry.name)
+        except OSError:
+            # Rename can fail across filesystems or when a target already exists; fall back to copying.
+            shutil.copytree(lsp, self._install_path, dirs_exist_ok=True)
 
     def _post_install(self, version: str) -> Path | None:
         config = self._install_path / "config.yml"
@@ -360,6 +668,38 @@ class MavenInstaller(TranspilerInstaller):
     # Maven Central, base URL.
     _maven_central_repo: str = "https://repo.maven.apache.org/maven2/"
 
+    # Guards the on-disk metadata cache used for conditional GETs against Maven Central.
+    _metadata_cache_lock = threading.Lock()
+
+    # In-process memoization of version probes: within a TTL window, repeated lookups for
+    # the same artifact skip the network entirely (the conditional GET below still guards
+    # correctness across processes).
+    _version_probe_ttl = 300.0
+    _version_probe_cache: dict[str, tuple[float, str | None]] = {}
+
+    @classmethod
+    def _metadata_cache_path(cls) -> Path:
+        # Deliberately outside transpilers_path(): writing there would bump the directory
+        # mtime that keys the transpiler config cache.
+        return cls.labs_path() / ".maven-metadata-cache.json"
+
+    @classmethod
+    def _load_metadata_cache(cls) -> dict[str, dict[str, str]]:
+        try:
+            data = loads(cls._metadata_cache_path().read_text("utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @classmethod
+    def _store_metadata_cache(cls, cache: dict[str, dict[str, str]]) -> None:
+        path = cls._metadata_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(dumps(cache), encoding="utf-8")
+        except OSError as e:
+            logger.debug(f"Could not store maven metadata cache: {path!s}", exc_info=e)
+
     @classmethod
     def _artifact_base_url(cls, group_id: str, artifact_id: str) -> str:
         """Construct the base URL for a Maven artifact."""
@@ -385,27 +725,89 @@ class MavenInstaller(TranspilerInstaller):
 
     @classmethod
     def get_current_maven_artifact_version(cls, group_id: str, artifact_id: str) -> str | None:
+        cache_key = f"{group_id}:{artifact_id}"
+        probed = cls._version_probe_cache.get(cache_key, None)
+        if probed and time.monotonic() - probed[0] < cls._version_probe_ttl:
+            return probed[1]
+        version = cls._fetch_current_maven_artifact_version(group_id, artifact_id)
+        cls._version_probe_cache[cache_key] = (time.monotonic(), version)
+        return version
+
+    @classmethod
+    def _fetch_current_maven_artifact_version(cls, group_id: str, artifact_id: str) -> str | None:
         url = cls.artifact_metadata_url(group_id, artifact_id)
+        cache_key = f"{group_id}:{artifact_id}"
+        with cls._metadata_cache_lock:
+            cache = cls._load_metadata_cache()
+        cached_entry = cache.get(cache_key, None)
         try:
-            with request.urlopen(url) as server:
-                text = server.read()
+            response = _http_pool.request("GET", url, headers=cls._conditional_headers(cached_entry))
         except HTTPError as e:
             logger.error(f"Error while fetching maven metadata: {group_id}:{artifact_id}", exc_info=e)
             return None
-        logger.debug(f"Maven metadata for {group_id}:{artifact_id}: {text}")
-        return cls._extract_latest_release_version(text)
+        if response.status == 304 and cached_entry:
+            logger.debug(f"Maven metadata for {group_id}:{artifact_id} unchanged, using cached version")
+            return cached_entry.get("version", None)
+        if response.status != 200:
+            logger.error(f"Error while fetching maven metadata: {group_id}:{artifact_id} (HTTP {response.status})")
+            return None
+        text = response.data
+        logger.debug(f"Maven metadata for {group_id}:{artifact_id}: {text.decode('utf-8', errors='replace')}")
+        version = cls._extract_latest_release_version(text)
+        cls._store_metadata_entry(cache_key, version, response)
+        return version
+
+    @staticmethod
+    def _conditional_headers(cached_entry: dict[str, str] | None) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if cached_entry:
+            if etag := cached_entry.get("etag", None):
+                headers["If-None-Match"] = etag
+            if last_modified := cached_entry.get("last_modified", None):
+                headers["If-Modified-Since"] = last_modified
+        return headers
+
+    @classmethod
+    def _store_metadata_entry(cls, cache_key: str, version: str | None, response: urllib3.BaseHTTPResponse) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not version or not (etag or last_modified):
+            return
+        entry = {"version": version}
+        if etag:
+            entry["etag"] = etag
+        if last_modified:
+            entry["last_modified"] = last_modified
+        with cls._metadata_cache_lock:
+            cache = cls._load_metadata_cache()
+            cache[cache_key] = entry
+            cls._store_metadata_cache(cache)
 
     @classmethod
-    def _extract_latest_release_version(cls, maven_metadata: str) -> str | None:
+    def _extract_latest_release_version(cls, maven_metadata: bytes | str) -> str | None:
         """Extract the latest release version from Maven metadata."""
         # Reference: https://maven.apache.org/repositories/metadata.html#The_A_Level_Metadata
         # TODO: Unit test this method, to verify the sequence of things it checks for.
-        root = ET.fromstring(maven_metadata)
-        for label in ("release", "latest"):
-            version = root.findtext(f"./versioning/{label}")
-            if version is not None:
-                return version
-        return root.findtext("./versioning/versions/version[last()]")
+        # Stream the document and return as soon as <release> closes, instead of building the full DOM.
+        if isinstance(maven_metadata, str):
+            maven_metadata = maven_metadata.encode("utf-8")
+        parents: list[str] = []
+        latest: str | None = None
+        last_version: str | None = None
+        for event, element in ET.iterparse(io.BytesIO(maven_metadata), events=("start", "end")):
+            if event == "start":
+                parents.append(element.tag)
+                continue
+            parents.pop()
+            if len(parents) == 2 and parents[-1] == "versioning":
+                if element.tag == "release" and element.text is not None:
+                    return element.text
+                if element.tag == "latest" and element.text is not None:
+                    latest = element.text
+                continue
+            if len(parents) == 3 and parents[-1] == "versions" and element.tag == "version":
+                last_version = element.text
+        return latest if latest is not None else last_version
 
     @classmethod
     def download_artifact_from_maven(
@@ -422,9 +824,9 @@ class MavenInstaller(TranspilerInstaller):
             return True
         url = cls.artifact_url(group_id, artifact_id, version, classifier, extension)
         try:
-            path, _ = request.urlretrieve(url)
+            path = cls._download_url(url)
             logger.debug(f"Downloaded maven artefact from {url} to {path}")
-        except URLError as e:
+        except HTTPError as e:
             logger.error(f"Unable to download maven artefact: {group_id}:{artifact_id}:{version}", exc_info=e)
             return False
         logger.debug(f"Moving {path} to {target}")
@@ -465,9 +867,8 @@ class MavenInstaller(TranspilerInstaller):
             rmtree(backup_path)
         if self._product_path.exists():
             os.rename(self._product_path, backup_path)
-        self._product_path.mkdir(parents=True)
         self._install_path = self._product_path / "lib"
-        self._install_path.mkdir()
+        self._install_path.mkdir(parents=True)
         try:
             if self._unsafe_install_version(version):
                 logger.info(f"Successfully installed {self._product_name} v{version}")
@@ -494,10 +895,11 @@ class MavenInstaller(TranspilerInstaller):
         return True
 
     def _copy_lsp_config(self, jar_file_path: Path) -> None:
+        # Stream the zip entry straight to its target, rather than extracting the
+        # intermediate 'lsp/' directory and moving the file up a level.
         with ZipFile(jar_file_path) as zip_file:
-            zip_file.extract("lsp/config.yml", self._install_path)
-        shutil.move(self._install_path / "lsp" / "config.yml", self._install_path / "config.yml")
-        os.rmdir(self._install_path / "lsp")
+            with zip_file.open("lsp/config.yml") as source, (self._install_path / "config.yml").open("wb") as target:
+                shutil.copyfileobj(source, target)
 
 
 class WorkspaceInstaller:
@@ -519,6 +921,9 @@ class WorkspaceInstaller:
         self._product_info = product_info
         self._resource_configurator = resource_configurator
         self._ws_installation = workspace_installation
+        self._transpiler_config_snapshot: dict[str, LSPConfig] | None = None
+        # Configs queued by _save_config, uploaded together when configuration completes.
+        self._pending_saves: list[TranspileConfig | ReconcileConfig] = []
 
         if not environ:
             environ = dict(os.environ.items())
@@ -532,8 +937,7 @@ class WorkspaceInstaller:
         if module == "transpile" and artifact:
             self.install_artifact(artifact)
         elif module in {"transpile", "all"}:
-            self.install_bladebridge()
-            self.install_morpheus()
+            self._install_bundled_transpilers(self.install_bladebridge, self.install_morpheus)
         if not config:
             config = self.configure(module)
         if self._is_testing():
@@ -542,6 +946,19 @@ class WorkspaceInstaller:
         logger.info("Installation completed successfully! Please refer to the documentation for the next steps.")
         return config
 
+    @staticmethod
+    def _install_bundled_transpilers(*installers: Callable[[], None]) -> None:
+        """Run the given transpiler installers in parallel.
+
+        The installers are independent and mostly blocked on network I/O, so N sequential
+        round-trips collapse to roughly the slowest one. Failures propagate after all
+        installers have been given a chance to run.
+        """
+        with ThreadPoolExecutor(max_workers=len(installers)) as executor:
+            futures = [executor.submit(installer) for installer in installers]
+            for future in futures:
+                future.result()
+
     @classmethod
     def install_bladebridge(cls, artifact: Path | None = None):
         local_name = "bladebridge"
@@ -571,7 +988,8 @@ class WorkspaceInstaller:
                 logger.warning(f"Java found, but could not determine the version: {java_executable}.")
                 return False
             case (java_executable, bytes(raw_version)):
-                logger.warning(f"Java found ({java_executable}), but could not parse the version:\n{raw_version}")
+                version_text = raw_version.decode("utf-8", errors="replace")
+                logger.warning(f"Java found ({java_executable}), but could not parse the version:\n{version_text}")
                 return False
             case (java_executable, tuple(old_version)) if old_version < (11, 0, 0, 0):
                 version_str = ".".join(str(v) for v in old_version)
@@ -598,7 +1016,8 @@ class WorkspaceInstaller:
         """Locate Java and return its version, as reported by `java -version`.
 
         The java executable is currently located by searching the system PATH. Its version is parsed from the output of
-        the `java -version` command, which has been standardized since Java 10.
+        the `java -version` command, which has been standardized since Java 10. Because the installed JRE does not
+        change within the lifetime of this process, the result is cached: only the first call spawns `java -version`.
 
         Returns:
             a tuple of its path and the version as a tuple of integers (feature, interim, update, patch), if the java
@@ -606,6 +1025,10 @@ class WorkspaceInstaller:
             returned, or `None` as a last resort. When no java executable is found, `None` is returned instead of a
             tuple.
         """
+        return _find_java()
+
+    @classmethod
+    def _detect_java(cls) -> tuple[Path, tuple[int, int, int, int] | bytes | None] | None:
         # Platform-independent way to reliably locate the java executable.
         # Reference: https://docs.python.org/3.10/library/subprocess.html#popen-constructor
         java_executable = shutil.which("java")
@@ -621,24 +1044,28 @@ class WorkspaceInstaller:
                 exc_info=e,
             )
             return java_executable_path, None
-        # It might not be ascii, but the bits we care about are so this will never fail.
         raw_output = completed.stderr
-        java_version_output = raw_output.decode("ascii", errors="ignore")
-        java_version = cls._parse_java_version(java_version_output)
+        java_version = cls._parse_java_version_bytes(raw_output)
         if java_version is None:
             return java_executable_path, raw_output.strip()
         logger.debug(f"Detected java version: {java_version}")
         return java_executable_path, java_version
 
     # Pattern to match a Java version string, compiled at import time to ensure it's valid.
+    # Compiled against bytes so the raw `java -version` output can be matched without decoding it.
     # Ref: https://docs.oracle.com/en/java/javase/11/install/version-string-format.html
     _java_version_pattern = re.compile(
-        r' version "(?P<feature>\d+)(?:\.(?P<interim>\d+)(?:\.(?P<update>\d+)(?:\.(?P<patch>\d+))?)?)?"'
+        rb' version "(?P<feature>\d+)(?:\.(?P<interim>\d+)(?:\.(?P<update>\d+)(?:\.(?P<patch>\d+))?)?)?"'
     )
 
     @classmethod
     def _parse_java_version(cls, version: str) -> tuple[int, int, int, int] | None:
         """Locate and parse the Java version in the output of `java -version`."""
+        # The bits we care about are ASCII, so encoding never loses anything relevant.
+        return cls._parse_java_version_bytes(version.encode("ascii", errors="ignore"))
+
+    @classmethod
+    def _parse_java_version_bytes(cls, version: bytes) -> tuple[int, int, int, int] | None:
         # Output looks like this:
         #   openjdk version "24.0.1" 2025-04-15
         #   OpenJDK Runtime Environment Temurin-24.0.1+9 (build 24.0.1+9)
@@ -654,21 +1081,27 @@ class WorkspaceInstaller:
         return feature, interim, update, patch
 
     def configure(self, module: str) -> RemorphConfigs:
-        match module:
-            case "transpile":
-                logger.info("Configuring lakebridge `transpile`.")
-                return RemorphConfigs(self._configure_transpile(), None)
-            case "reconcile":
-                logger.info("Configuring lakebridge `reconcile`.")
-                return RemorphConfigs(None, self._configure_reconcile())
-            case "all":
-                logger.info("Configuring lakebridge `transpile` and `reconcile`.")
-                return RemorphConfigs(
-                    self._configure_transpile(),
-                    self._configure_reconcile(),
-                )
-            case _:
-                raise ValueError(f"Invalid input: {module}")
+        # Flush even when a later step aborts: a config the user already entered must
+        # still be uploaded, just as it was when each save round-tripped immediately.
+        try:
+            match module:
+                case "transpile":
+                    logger.info("Configuring lakebridge `transpile`.")
+                    configs = RemorphConfigs(self._configure_transpile(), None)
+                case "reconcile":
+                    logger.info("Configuring lakebridge `reconcile`.")
+                    configs = RemorphConfigs(None, self._configure_reconcile())
+                case "all":
+                    logger.info("Configuring lakebridge `transpile` and `reconcile`.")
+                    configs = RemorphConfigs(
+                        self._configure_transpile(),
+                        self._configure_reconcile(),
+                    )
+                case _:
+                    raise ValueError(f"Invalid input: {module}")
+        finally:
+            self._flush_pending_saves()
+        return configs
 
     def _is_testing(self):
         return self._product_info.product_name() != "lakebridge"
@@ -712,16 +1145,28 @@ class WorkspaceInstaller:
         self._save_config(config)
         return config
 
+    def _transpiler_configs(self) -> dict[str, LSPConfig]:
+        if self._transpiler_config_snapshot is None:
+            self._transpiler_config_snapshot = TranspilerInstaller.all_transpiler_configs()
+        return self._transpiler_config_snapshot
+
     def _all_installed_dialects(self) -> list[str]:
-        return sorted(TranspilerInstaller.all_dialects())
+        configs = self._transpiler_configs()
+        return sorted({dialect for config in configs.values() for dialect in config.remorph.dialects})
 
     def _transpilers_with_dialect(self, dialect: str) -> list[str]:
-        return sorted(TranspilerInstaller.transpilers_with_dialect(dialect))
+        configs = self._transpiler_configs()
+        return sorted(config.name for config in configs.values() if dialect in config.remorph.dialect_set)
 
     def _transpiler_config_path(self, transpiler: str) -> Path:
-        return TranspilerInstaller.transpiler_config_path(transpiler)
+        config = self._transpiler_configs().get(transpiler, None)
+        if not config:
+            raise ValueError(f"No such transpiler: {transpiler}")
+        return config.path
 
     def _prompt_for_new_transpile_installation(self) -> TranspileConfig:
+        # Snapshot the installed transpiler configs once; the prompts below query them several times.
+        self._transpiler_config_snapshot = TranspilerInstaller.all_transpiler_configs()
         install_later = "Set it later"
         # TODO tidy this up, logger might not display the below in console...
         logger.info("Please answer a few questions to configure lakebridge `transpile`")
@@ -824,14 +1269,11 @@ class WorkspaceInstaller:
 
     def _prompt_for_new_reconcile_installation(self) -> ReconcileConfig:
         logger.info("Please answer a few questions to configure lakebridge `reconcile`")
-        data_source = self._prompts.choice(
-            "Select the Data Source:", [source_type.value for source_type in ReconSourceType]
-        )
-        report_type = self._prompts.choice(
-            "Select the report type:", [report_type.value for report_type in ReconReportType]
-        )
+        data_source = self._prompts.choice("Select the Data Source:", list(_RECON_SOURCE_CHOICES))
+        report_type = self._prompts.choice("Select the report type:", list(_RECON_REPORT_CHOICES))
+        cap = data_source.capitalize()
         scope_name = self._prompts.question(
-            f"Enter Secret scope name to store `{data_source.capitalize()}` connection details / secrets",
+            f"Enter Secret scope name to store `{cap}` connection details / secrets",
             default=f"remorph_{data_source}",
         )
 
@@ -847,13 +1289,13 @@ class WorkspaceInstaller:
         )
 
     def _prompt_for_reconcile_database_config(self, source) -> DatabaseConfig:
+        cap = source.capitalize()
         source_catalog = None
         if source == ReconSourceType.SNOWFLAKE.value:
-            source_catalog = self._prompts.question(f"Enter source catalog name for `{source.capitalize()}`")
+            source_catalog = self._prompts.question(f"Enter source catalog name for `{cap}`")
 
-        schema_prompt = f"Enter source schema name for `{source.capitalize()}`"
-        if source in {ReconSourceType.ORACLE.value}:
-            schema_prompt = f"Enter source database name for `{source.capitalize()}`"
+        schema_kind = "database" if source in _ORACLE_LIKE_SOURCES else "schema"
+        schema_prompt = f"Enter source {schema_kind} name for `{cap}`"
 
         source_schema = self._prompts.question(schema_prompt)
         target_catalog = self._prompts.question("Enter target catalog name for Databricks")
@@ -890,11 +1332,35 @@ class WorkspaceInstaller:
         )
 
     def _save_config(self, config: TranspileConfig | ReconcileConfig):
-        logger.info(f"Saving configuration file {config.__file__}")
-        self._installation.save(config)
-        ws_file_url = self._installation.workspace_link(config.__file__)
-        if self._prompts.confirm(f"Open config file {ws_file_url} in the browser?"):
-            webbrowser.open(ws_file_url)
+        self._pending_saves.append(config)
+
+    def _flush_pending_saves(self) -> None:
+        configs, self._pending_saves = self._pending_saves, []
+        if not configs:
+            return
+        for config in configs:
+            logger.info(f"Saving configuration file {config.__file__}")
+        if len(configs) == 1:
+            self._installation.save(configs[0])
+        else:
+            # The uploads are independent workspace round-trips; overlap them.
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                for _ in executor.map(self._installation.save, configs):
+                    pass
+        ws_file_urls = [self._installation.workspace_link(config.__file__) for config in configs]
+        if self._prompts.confirm(f"Open config file {', '.join(ws_file_urls)} in the browser?"):
+            for ws_file_url in ws_file_urls:
+                try:
+                    # Fire-and-forget: opening a browser can block for seconds on some platforms.
+                    threading.Thread(target=webbrowser.open, args=(ws_file_url,), daemon=True).start()
+                except RuntimeError:
+                    webbrowser.open(ws_file_url)
 
     def _has_necessary_access(self, catalog_name: str, schema_name: str, volume_name: str | None = None):
         self._resource_configurator.has_necessary_access(catalog_name, schema_name, volume_name)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_java() -> tuple[Path, tuple[int, int, int, int] | bytes | None] | None:
+    """Detect java once per process; see `WorkspaceInstaller.find_java` for the contract."""
+    return WorkspaceInstaller._detect_java()  # pylint: disable=protected-access
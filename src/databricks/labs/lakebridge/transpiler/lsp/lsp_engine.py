@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import functools
 import logging
 import os
 import sys
@@ -47,6 +48,9 @@ from databricks.labs.lakebridge.transpiler.transpile_status import (
 
 logger = logging.getLogger(__name__)
 
+# The LibYAML-backed loader is considerably faster than the pure-Python one.
+_YamlLoader: type = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class _LSPRemorphConfigV1:
@@ -55,6 +59,11 @@ class _LSPRemorphConfigV1:
     env_vars: dict[str, str]
     command_line: list[str]
 
+    @functools.cached_property
+    def dialect_set(self) -> frozenset[str]:
+        """The dialects as a frozenset, for O(1) membership tests."""
+        return frozenset(self.dialects)
+
     @classmethod
     def parse(cls, data: dict[str, Any]) -> _LSPRemorphConfigV1:
         version = data.get("version", 0)
@@ -77,20 +86,26 @@ class _LSPRemorphConfigV1:
 class LSPConfig:
     path: Path
     remorph: _LSPRemorphConfigV1
-    options: dict[str, list[LSPConfigOptionV1]]
+    options_data: dict[str, Any]
     custom: dict[str, Any]
 
     @property
     def name(self):
         return self.remorph.name
 
+    @functools.cached_property
+    def options(self) -> dict[str, list[LSPConfigOptionV1]]:
+        # Parsed lazily: most callers only need the name and dialects, for indexing.
+        # Malformed entries are already rejected by load(), see _check_options_data.
+        return LSPConfigOptionV1.parse_all(self.options_data)
+
     def options_for_dialect(self, source_dialect: str) -> list[LSPConfigOptionV1]:
         return self.options.get("all", []) + self.options.get(source_dialect, [])
 
     @classmethod
     def load(cls, path: Path) -> LSPConfig:
         yaml_text = path.read_text()
-        data = yaml.safe_load(yaml_text)
+        data = yaml.load(yaml_text, Loader=_YamlLoader)
         if not isinstance(data, dict):
             raise ValueError(f"Invalid transpiler config, expecting a dict, got a {type(data).__name__}")
         remorph_data = data.get("remorph", None)
@@ -100,9 +115,23 @@ class LSPConfig:
         options_data = data.get("options", {})
         if not isinstance(options_data, dict):
             raise ValueError(f"Invalid transpiler config, expecting an 'options' dict entry, got {options_data}")
-        options = LSPConfigOptionV1.parse_all(options_data)
+        cls._check_options_data(options_data)
         custom = data.get("custom", {})
-        return LSPConfig(path, remorph, options, custom)
+        return LSPConfig(path, remorph, options_data, custom)
+
+    @staticmethod
+    def _check_options_data(options_data: dict[str, Any]) -> None:
+        # Structural check only, so that a malformed config is still rejected at load time
+        # while the full parse into LSPConfigOptionV1 instances remains lazy.
+        for dialect, entries in options_data.items():
+            if not isinstance(entries, list):
+                raise ValueError(f"Invalid transpiler config options for '{dialect}', expecting a list, got {entries}")
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    raise ValueError(f"Invalid transpiler config option, expecting a dict entry, got {entry}")
+                for key in ("flag", "method", "prompt"):
+                    if not entry.get(key, ""):
+                        raise ValueError(f"Missing '{key}' entry in {entry}")
 
 
 def lsp_feature(
@@ -210,29 +210,18 @@ def report_tables_schema():
     return recon_schema, metrics_schema, details_schema
 
 
+_TRANSPILER_CONFIGS = Path(__file__).resolve().parent / "resources" / "transpiler_configs"
+_BLADEBRIDGE_WHEEL = _TRANSPILER_CONFIGS / "bladebridge" / "wheel" / "databricks_bb_plugin-0.1.9-py3-none-any.whl"
+_MORPHEUS_JAR = _TRANSPILER_CONFIGS / "morpheus" / "jar" / "databricks-morph-plugin-0.4.0.jar"
+
+
 @pytest.fixture
 def bladebridge_artifact() -> Path:
-    artifact = (
-        Path(__file__).parent
-        / "resources"
-        / "transpiler_configs"
-        / "bladebridge"
-        / "wheel"
-        / "databricks_bb_plugin-0.1.9-py3-none-any.whl"
-    )
-    assert artifact.exists()
-    return artifact
+    assert _BLADEBRIDGE_WHEEL.exists()
+    return _BLADEBRIDGE_WHEEL
 
 
 @pytest.fixture
 def morpheus_artifact() -> Path:
-    artifact = (
-        Path(__file__).parent
-        / "resources"
-        / "transpiler_configs"
-        / "morpheus"
-        / "jar"
-        / "databricks-morph-plugin-0.4.0.jar"
-    )
-    assert artifact.exists()
-    return artifact
+    assert _MORPHEUS_JAR.exists()
+    return _MORPHEUS_JAR
@@ -1,8 +1,7 @@
-import asyncio
+import re
 import shutil
 import sys
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from unittest.mock import patch
 from email import policy
 from email.message import Message
@@ -28,17 +27,30 @@ def process_email_content(msg: str) -> str | None:
     return result
 
 
+_WS_NEWLINE_RE = re.compile(r"[ \t]*\n[ \t]*")
+
+
 def format_transpiled(sql: str) -> str:
-    parts = sql.lower().split("\n")
-    stripped = [s.strip() for s in parts]
-    sql = " ".join(stripped)
-    return sql
+    low = sql.lower()
+    if "\n" not in low:
+        # Fast path: most transpiled snippets are already single-line.
+        return low.strip()
+    return _WS_NEWLINE_RE.sub(" ", low).strip()
+
+
+def _work_folders(tmp_path: Path) -> tuple[str, str]:
+    # pytest cleans tmp_path up in bulk, avoiding a TemporaryDirectory teardown per folder.
+    input_source = tmp_path / "input_source"
+    output_folder = tmp_path / "output_folder"
+    input_source.mkdir(exist_ok=True)
+    output_folder.mkdir(exist_ok=True)
+    return str(input_source), str(output_folder)
 
 
-async def run_lsp_operations_sync(
+async def run_lsp_operations(
     lsp_engine: LSPEngine, transpile_config: TranspileConfig, input_source: str, sql_code: str
 ) -> TranspileResult:
-    """Helper function to run LSP operations synchronously"""
+    """Initialize the engine, transpile a single query, and shut the engine down."""
     await lsp_engine.initialize(transpile_config)
     dialect = transpile_config.source_dialect or ""  # Ensure it's a string
     input_file = Path(input_source) / "some_query.sql"
@@ -47,13 +59,12 @@ async def run_lsp_operations_sync(
     return result
 
 
-def test_installs_and_runs_local_bladebridge(bladebridge_artifact: Path) -> None:
-    with TemporaryDirectory() as tmpdir:
-        with patch.object(TranspilerInstaller, "labs_path", return_value=Path(tmpdir)):
-            _install_and_run_local_bladebridge(bladebridge_artifact)
+async def test_installs_and_runs_local_bladebridge(bladebridge_artifact: Path, tmp_path: Path) -> None:
+    with patch.object(TranspilerInstaller, "labs_path", return_value=tmp_path / "labs"):
+        await _install_and_run_local_bladebridge(bladebridge_artifact, tmp_path)
 
 
-def _install_and_run_local_bladebridge(bladebridge_artifact: Path) -> None:
+async def _install_and_run_local_bladebridge(bladebridge_artifact: Path, tmp_path: Path) -> None:
     bladebridge = TranspilerInstaller.transpilers_path() / "bladebridge"
     assert not bladebridge.exists()
     TranspilerInstaller.install_from_pypi("bladebridge", "databricks-bb-plugin", bladebridge_artifact)
@@ -62,35 +73,34 @@ def _install_and_run_local_bladebridge(bladebridge_artifact: Path) -> None:
     version_path = bladebridge / "state" / "version.json"
     assert version_path.exists()
     lsp_engine = LSPEngine.from_config_path(config_path)
-    with TemporaryDirectory() as input_source:
-        with TemporaryDirectory() as output_folder:
-            transpile_config = TranspileConfig(
-                transpiler_config_path=str(config_path),
-                source_dialect="oracle",
-                input_source=input_source,
-                output_folder=output_folder,
-                sdk_config={"cluster_id": "test_cluster"},
-                skip_validation=False,
-                catalog_name="catalog",
-                schema_name="schema",
-            )
-
-            sql_code = "select * from employees"
-            result = asyncio.run(run_lsp_operations_sync(lsp_engine, transpile_config, input_source, sql_code))
-            transpiled = process_email_content(result.transpiled_code)
-            assert transpiled == sql_code
-
-
-def test_installs_and_runs_pypi_bladebridge(tmp_path: Path) -> None:
+    input_source, output_folder = _work_folders(tmp_path)
+    transpile_config = TranspileConfig(
+        transpiler_config_path=str(config_path),
+        source_dialect="oracle",
+        input_source=input_source,
+        output_folder=output_folder,
+        sdk_config={"cluster_id": "test_cluster"},
+        skip_validation=False,
+        catalog_name="catalog",
+        schema_name="schema",
+    )
+
+    sql_code = "select * from employees"
+    result = await run_lsp_operations(lsp_engine, transpile_config, input_source, sql_code)
+    transpiled = process_email_content(result.transpiled_code)
+    assert transpiled == sql_code
+
+
+async def test_installs_and_runs_pypi_bladebridge(tmp_path: Path) -> None:
     if sys.platform == "win32":
-        _install_and_run_pypi_bladebridge()
+        await _install_and_run_pypi_bladebridge(tmp_path)
     else:
         labs_path = tmp_path / "labs"
         with patch.object(TranspilerInstaller, "labs_path", return_value=labs_path):
-            _install_and_run_pypi_bladebridge()
+            await _install_and_run_pypi_bladebridge(tmp_path)
 
 
-def _install_and_run_pypi_bladebridge() -> None:
+async def _install_and_run_pypi_bladebridge(tmp_path: Path) -> None:
     bladebridge = TranspilerInstaller.transpilers_path() / "bladebridge"
     if sys.platform == "win32" and bladebridge.exists():
         shutil.rmtree(bladebridge)
@@ -101,32 +111,30 @@ def _install_and_run_pypi_bladebridge() -> None:
     version_path = bladebridge / "state" / "version.json"
     assert version_path.exists()
     lsp_engine = LSPEngine.from_config_path(config_path)
-    with TemporaryDirectory() as input_source:
-        with TemporaryDirectory() as output_folder:
-            transpile_config = TranspileConfig(
-                transpiler_config_path=str(config_path),
-                source_dialect="oracle",
-                input_source=input_source,
-                output_folder=output_folder,
-                sdk_config={"cluster_id": "test_cluster"},
-                skip_validation=False,
-                catalog_name="catalog",
-                schema_name="schema",
-            )
-
-            sql_code = "select * from employees"
-            result = asyncio.run(run_lsp_operations_sync(lsp_engine, transpile_config, input_source, sql_code))
-            transpiled = process_email_content(result.transpiled_code)
-            assert transpiled == sql_code
-
-
-def test_installs_and_runs_local_morpheus(morpheus_artifact):
-    with TemporaryDirectory() as tmpdir:
-        with patch.object(TranspilerInstaller, "labs_path", return_value=Path(tmpdir)):
-            _install_and_run_local_morpheus(morpheus_artifact)
-
-
-def _install_and_run_local_morpheus(morpheus_artifact):
+    input_source, output_folder = _work_folders(tmp_path)
+    transpile_config = TranspileConfig(
+        transpiler_config_path=str(config_path),
+        source_dialect="oracle",
+        input_source=input_source,
+        output_folder=output_folder,
+        sdk_config={"cluster_id": "test_cluster"},
+        skip_validation=False,
+        catalog_name="catalog",
+        schema_name="schema",
+    )
+
+    sql_code = "select * from employees"
+    result = await run_lsp_operations(lsp_engine, transpile_config, input_source, sql_code)
+    transpiled = process_email_content(result.transpiled_code)
+    assert transpiled == sql_code
+
+
+async def test_installs_and_runs_local_morpheus(morpheus_artifact, tmp_path: Path):
+    with patch.object(TranspilerInstaller, "labs_path", return_value=tmp_path / "labs"):
+        await _install_and_run_local_morpheus(morpheus_artifact, tmp_path)
+
+
+async def _install_and_run_local_morpheus(morpheus_artifact, tmp_path: Path):
     morpheus = TranspilerInstaller.transpilers_path() / "morpheus"
     assert not morpheus.exists()
     TranspilerInstaller.install_from_maven(
@@ -140,20 +148,19 @@ def _install_and_run_local_morpheus(morpheus_artifact):
     version_path = morpheus / "state" / "version.json"
     assert version_path.exists()
     lsp_engine = LSPEngine.from_config_path(config_path)
-    with TemporaryDirectory() as input_source:
-        with TemporaryDirectory() as output_folder:
-            transpile_config = TranspileConfig(
-                transpiler_config_path=str(config_path),
-                source_dialect="snowflake",
-                input_source=input_source,
-                output_folder=output_folder,
-                sdk_config={"cluster_id": "test_cluster"},
-                skip_validation=False,
-                catalog_name="catalog",
-                schema_name="schema",
-            )
-
-            sql_code = "select * from employees;"
-            result = asyncio.run(run_lsp_operations_sync(lsp_engine, transpile_config, input_source, sql_code))
-            transpiled = format_transpiled(result.transpiled_code)
-            assert transpiled == sql_code
+    input_source, output_folder = _work_folders(tmp_path)
+    transpile_config = TranspileConfig(
+        transpiler_config_path=str(config_path),
+        source_dialect="snowflake",
+        input_source=input_source,
+        output_folder=output_folder,
+        sdk_config={"cluster_id": "test_cluster"},
+        skip_validation=False,
+        catalog_name="catalog",
+        schema_name="schema",
+    )
+
+    sql_code = "select * from employees;"
+    result = await run_lsp_operations(lsp_engine, transpile_config, input_source, sql_code)
+    transpiled = format_transpiled(result.transpiled_code)
+    assert transpiled == sql_code
@@ -1,13 +1,15 @@
 import os
 import shutil
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from unittest.mock import patch
+from uuid import uuid4
 
 import pytest
 
 from databricks.labs.lakebridge.install import TranspilerInstaller, MavenInstaller, WorkspaceInstaller, WheelInstaller
 
+_TRANSPILER_CONFIGS = Path(__file__).resolve().parents[2] / "resources" / "transpiler_configs"
+
 
 @pytest.mark.skipif(os.environ.get("CI", "false") == "true", reason="Skipping in CI since we have no installed product")
 def test_gets_installed_remorph_version(patched_transpiler_installer):
@@ -21,15 +23,14 @@ def test_gets_maven_artifact_version() -> None:
     check_valid_version(version)
 
 
-def test_downloads_from_maven():
-    with TemporaryDirectory() as parent:
-        path = Path(parent) / "pom.xml"
-        success = MavenInstaller.download_artifact_from_maven(
-            "com.databricks", "databricks-connect", "16.0.0", path, extension="pom"
-        )
-        assert success
-        assert path.exists()
-        assert path.stat().st_size == 5_684
+def test_downloads_from_maven(download_dir: Path):
+    path = download_dir / f"pom-{uuid4()}.xml"
+    success = MavenInstaller.download_artifact_from_maven(
+        "com.databricks", "databricks-connect", "16.0.0", path, extension="pom"
+    )
+    assert success
+    assert path.exists()
+    assert path.stat().st_size == 5_684
 
 
 def test_gets_pypi_artifact_version():
@@ -37,39 +38,37 @@ def test_gets_pypi_artifact_version():
     check_valid_version(version)
 
 
-def test_downloads_tar_from_pypi():
-    with TemporaryDirectory() as parent:
-        path = Path(parent) / "archive.tar"
-        result = WheelInstaller.download_artifact_from_pypi(
-            "databricks-labs-remorph-community-transpiler", "0.0.1", path, extension="tar"
-        )
-        assert result == 0
-        assert path.exists()
-        assert path.stat().st_size == 41_656
+def test_downloads_tar_from_pypi(download_dir: Path):
+    path = download_dir / f"archive-{uuid4()}.tar"
+    result = WheelInstaller.download_artifact_from_pypi(
+        "databricks-labs-remorph-community-transpiler", "0.0.1", path, extension="tar"
+    )
+    assert result == 0
+    assert path.exists()
+    assert path.stat().st_size == 41_656
+
+
+def test_downloads_whl_from_pypi(download_dir: Path):
+    path = download_dir / f"package-{uuid4()}.whl"
+    result = WheelInstaller.download_artifact_from_pypi("databricks-labs-remorph-community-transpiler", "0.0.1", path)
+    assert result == 0
+    assert path.exists()
+    assert path.stat().st_size == 35_270
 
 
-def test_downloads_whl_from_pypi():
-    with TemporaryDirectory() as parent:
-        path = Path(parent) / "package.whl"
-        result = WheelInstaller.download_artifact_from_pypi(
-            "databricks-labs-remorph-community-transpiler", "0.0.1", path
-        )
-        assert result == 0
-        assert path.exists()
-        assert path.stat().st_size == 35_270
+@pytest.fixture(scope="session")
+def download_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # One session-scoped folder, cleaned up in bulk by pytest rather than per test.
+    return tmp_path_factory.mktemp("downloads")
 
 
 @pytest.fixture()
 def patched_transpiler_installer(tmp_path: Path):
-    resources_folder = Path(__file__).parent.parent.parent / "resources" / "transpiler_configs"
+    resources_folder = _TRANSPILER_CONFIGS
     for transpiler in ("bladebridge", "morpheus"):
-        target = tmp_path / transpiler
-        target.mkdir(exist_ok=True)
-        target = target / "lib"
-        target.mkdir(exist_ok=True)
-        target = target / "config.yml"
-        source = resources_folder / transpiler / "lib" / "config.yml"
-        shutil.copyfile(source, target)
+        lib = tmp_path / transpiler / "lib"
+        lib.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(resources_folder / transpiler / "lib" / "config.yml", lib / "config.yml")
     with patch.object(TranspilerInstaller, "transpilers_path", return_value=tmp_path):
         yield TranspilerInstaller
 
@@ -14,6 +14,8 @@ from databricks.labs.lakebridge.transpiler.lsp.lsp_engine import LSPEngine
 
 logger = logging.getLogger(__name__)
 
+_INFORMATICA_RESOURCES = Path(__file__).resolve().parents[2] / "resources" / "functional" / "informatica"
+
 
 # TODO use artifact from PyPI once 0.1.5 is published
 @pytest.mark.skipif(
@@ -32,7 +34,7 @@ async def _transpile_informatica_with_sparksql(ws: Any, bladebridge_artifact: Pa
     # check execution
     config_path = TranspilerInstaller.transpilers_path() / "bladebridge" / "lib" / "config.yml"
     lsp_engine = LSPEngine.from_config_path(config_path)
-    input_source = Path(__file__).parent.parent.parent / "resources" / "functional" / "informatica"
+    input_source = _INFORMATICA_RESOURCES
     with TemporaryDirectory() as output_folder:
         transpile_config = TranspileConfig(
             transpiler_config_path=str(config_path),
@@ -8,6 +8,8 @@ from databricks.labs.lakebridge.install import TranspilerInstaller
 from databricks.labs.lakebridge.transpiler.execute import transpile
 from databricks.labs.lakebridge.transpiler.lsp.lsp_engine import LSPEngine
 
+_DBT_RESOURCES = Path(__file__).resolve().parents[2] / "resources" / "functional" / "dbt"
+
 
 async def test_transpiles_all_dbt_project_files(ws):
     with TemporaryDirectory() as tmpdir:
@@ -22,7 +24,7 @@ async def _transpile_all_dbt_project_files(ws: Any):
     # check execution
     config_path = morpheus / "lib" / "config.yml"
     lsp_engine = LSPEngine.from_config_path(config_path)
-    input_source = Path(__file__).parent.parent.parent / "resources" / "functional" / "dbt"
+    input_source = _DBT_RESOURCES
     with TemporaryDirectory() as output_folder:
         transpile_config = TranspileConfig(
             transpiler_config_path=str(config_path),
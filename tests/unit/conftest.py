@@ -29,6 +29,9 @@ from .transpiler.helpers.functional_test_cases import (
     expected_exceptions,
 )
 
+# Prefer the LibYAML C backend when available; it serializes much faster.
+_YamlDumper: type = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @pytest.fixture(scope="session")
 def mock_databricks_config():
@@ -220,50 +223,57 @@ def path_to_resource(*args: str) -> str:
     return str(resource_path)
 
 
-@pytest.fixture
-def mock_workspace_client() -> WorkspaceClient:
-    state = {
-        "/Users/foo/.lakebridge/config.yml": yaml.dump(
-            {
-                'version': 3,
-                'catalog_name': 'transpiler',
-                'schema_name': 'remorph',
-                'transpiler_config_path': 'sqlglot',
-                'source_dialect': 'snowflake',
-                'sdk_config': {'cluster_id': 'test_cluster'},
-            }
-        ),
-        "/Users/foo/.lakebridge/recon_config.yml": yaml.dump(
+# Serialized once at import: the workspace state is invariant across tests, so each
+# mock_workspace_client invocation reuses the same rendered YAML.
+_CONFIG_YML = yaml.dump(
+    {
+        'version': 3,
+        'catalog_name': 'transpiler',
+        'schema_name': 'remorph',
+        'transpiler_config_path': 'sqlglot',
+        'source_dialect': 'snowflake',
+        'sdk_config': {'cluster_id': 'test_cluster'},
+    },
+    Dumper=_YamlDumper,
+)
+_RECON_CONFIG_YML = yaml.dump(
+    {
+        'version': 1,
+        'source_schema': "src_schema",
+        'target_catalog': "src_catalog",
+        'target_schema': "tgt_schema",
+        'tables': [
             {
-                'version': 1,
-                'source_schema': "src_schema",
-                'target_catalog': "src_catalog",
-                'target_schema': "tgt_schema",
-                'tables': [
-                    {
-                        "source_name": 'src_table',
-                        "target_name": 'tgt_table',
-                        "join_columns": ['id'],
-                        "jdbc_reader_options": None,
-                        "select_columns": None,
-                        "drop_columns": None,
-                        "column_mapping": None,
-                        "transformations": None,
-                        "thresholds": None,
-                        "filters": None,
-                    }
-                ],
-                'source_catalog': "src_catalog",
+                "source_name": 'src_table',
+                "target_name": 'tgt_table',
+                "join_columns": ['id'],
+                "jdbc_reader_options": None,
+                "select_columns": None,
+                "drop_columns": None,
+                "column_mapping": None,
+                "transformations": None,
+                "thresholds": None,
+                "filters": None,
             }
-        ),
-    }
+        ],
+        'source_catalog': "src_catalog",
+    },
+    Dumper=_YamlDumper,
+)
+_WORKSPACE_STATE = {
+    "/Users/foo/.lakebridge/config.yml": _CONFIG_YML,
+    "/Users/foo/.lakebridge/recon_config.yml": _RECON_CONFIG_YML,
+}
+
 
+@pytest.fixture
+def mock_workspace_client() -> WorkspaceClient:
     def download(path: str) -> io.StringIO | io.BytesIO:
-        if path not in state:
+        if path not in _WORKSPACE_STATE:
             raise NotFound(path)
         if ".csv" in path:
-            return io.BytesIO(state[path].encode('utf-8'))
-        return io.StringIO(state[path])
+            return io.BytesIO(_WORKSPACE_STATE[path].encode('utf-8'))
+        return io.StringIO(_WORKSPACE_STATE[path])
 
     workspace_client = create_autospec(WorkspaceClient)
     workspace_client.current_user.me().user_name = "foo"
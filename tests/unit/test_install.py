@@ -2,6 +2,7 @@ import datetime as dt
 import json
 import os
 import shutil
+from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import create_autospec, patch
 
@@ -22,6 +23,7 @@ from databricks.labs.lakebridge.contexts.application import ApplicationContext
 from databricks.labs.lakebridge.deployment.configurator import ResourceConfigurator
 from databricks.labs.lakebridge.deployment.installation import WorkspaceInstallation
 from databricks.labs.lakebridge.install import WorkspaceInstaller, TranspilerInstaller
+from databricks.labs.lakebridge.transpiler.lsp.lsp_engine import LSPConfig
 from databricks.labs.lakebridge.config import TranspileConfig
 from databricks.labs.blueprint.wheels import ProductInfo, WheelsV2
 from databricks.labs.lakebridge.reconcile.constants import ReconSourceType, ReconReportType
@@ -1394,3 +1396,95 @@ def test_java_version_parse_missing() -> None:
     version_output = "Nothing in here that looks like a version."
     parsed = FriendOfWorkspaceInstaller.parse_java_version(version_output)
     assert parsed is None
+
+
+class FriendOfTranspilerInstaller(TranspilerInstaller):
+    """A friend class to access protected methods for testing purposes."""
+
+    @classmethod
+    def reset_caches(cls) -> None:
+        cls._invalidate_config_cache()
+
+    @classmethod
+    def index_cache_path(cls) -> Path | None:
+        return cls._index_cache_path()
+
+
+def _write_transpiler_config(transpilers_path: Path, product: str, name: str, dialects: list[str]) -> Path:
+    """Write a minimal transpiler config.yml for a product, returning its path."""
+    config_path = transpilers_path / product / "lib" / "config.yml"
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_path.write_text(
+        "remorph:\n"
+        "  version: 1\n"
+        f"  name: {name}\n"
+        "  dialects:\n" + "".join(f"    - {dialect}\n" for dialect in dialects) + "  command_line:\n"
+        "    - python\n"
+        "    - server.py\n",
+        encoding="utf-8",
+    )
+    return config_path
+
+
+@pytest.fixture
+def isolated_labs_path(tmp_path: Path) -> Generator[Path, None, None]:
+    """A temporary labs path in the standard layout, with clean transpiler caches."""
+    FriendOfTranspilerInstaller.reset_caches()
+    with patch.object(FriendOfTranspilerInstaller, "labs_path", return_value=tmp_path):
+        yield tmp_path
+    FriendOfTranspilerInstaller.reset_caches()
+
+
+def test_transpiler_index_serves_summaries_without_parsing(isolated_labs_path: Path) -> None:
+    """Verify that name and dialect queries are served from the persistent index without parsing YAML."""
+    transpilers = FriendOfTranspilerInstaller.transpilers_path()
+    _write_transpiler_config(transpilers, "thing", "Thing", ["snowflake", "tsql"])
+    assert FriendOfTranspilerInstaller.all_transpiler_names() == {"Thing"}
+    assert (isolated_labs_path / ".transpiler-index.json").exists()
+
+    # Drop the in-process caches: the queries below must be answered from the index alone.
+    FriendOfTranspilerInstaller.reset_caches()
+    with patch.object(LSPConfig, "load", side_effect=AssertionError("the config should not be parsed")):
+        assert FriendOfTranspilerInstaller.all_transpiler_names() == {"Thing"}
+        assert FriendOfTranspilerInstaller.all_dialects() == {"snowflake", "tsql"}
+        assert FriendOfTranspilerInstaller.transpilers_with_dialect("tsql") == {"Thing"}
+
+
+def test_transpiler_index_invalidated_by_edited_config(isolated_labs_path: Path) -> None:
+    """Verify that editing a config after the index was written forces a fresh scan."""
+    transpilers = FriendOfTranspilerInstaller.transpilers_path()
+    _write_transpiler_config(transpilers, "thing", "Thing", ["snowflake"])
+    assert FriendOfTranspilerInstaller.all_dialects() == {"snowflake"}
+
+    FriendOfTranspilerInstaller.reset_caches()
+    _write_transpiler_config(transpilers, "thing", "Thing", ["snowflake", "oracle"])
+    assert FriendOfTranspilerInstaller.all_dialects() == {"snowflake", "oracle"}
+
+
+def test_transpiler_index_skips_invalid_config_without_reparsing(isolated_labs_path: Path) -> None:
+    """Verify that a config that failed to load is skipped without being parsed again."""
+    transpilers = FriendOfTranspilerInstaller.transpilers_path()
+    _write_transpiler_config(transpilers, "good", "Good", ["snowflake"])
+    broken = transpilers / "broken" / "lib" / "config.yml"
+    broken.parent.mkdir(parents=True)
+    broken.write_text("- not a transpiler config\n", encoding="utf-8")
+    assert FriendOfTranspilerInstaller.all_transpiler_names() == {"Good"}
+
+    FriendOfTranspilerInstaller.reset_caches()
+    with patch.object(LSPConfig, "load", side_effect=AssertionError("the config should not be parsed")):
+        assert FriendOfTranspilerInstaller.all_transpiler_names() == {"Good"}
+
+
+def test_transpiler_index_not_written_off_standard_layout(tmp_path: Path) -> None:
+    """Verify that no index file is written when transpilers_path() is patched off the standard layout."""
+    transpilers = tmp_path / "transpilers"
+    _write_transpiler_config(transpilers, "thing", "Thing", ["snowflake"])
+    FriendOfTranspilerInstaller.reset_caches()
+    try:
+        with patch.object(FriendOfTranspilerInstaller, "transpilers_path", return_value=transpilers):
+            assert FriendOfTranspilerInstaller.index_cache_path() is None
+            assert FriendOfTranspilerInstaller.all_transpiler_names() == {"Thing"}
+    finally:
+        FriendOfTranspilerInstaller.reset_caches()
+    assert not (tmp_path / ".transpiler-index.json").exists()
+    assert not (transpilers / ".transpiler-index.json").exists()